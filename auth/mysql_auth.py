@@ -6,6 +6,7 @@ MySQL-based authentication for Java Peer Review Training System.
 import logging
 import datetime
 import hashlib
+import hmac
 import uuid
 from typing import Dict, Any, List, Optional
 from db.mysql_connection import MySQLConnection
@@ -17,6 +18,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Profile fields that update_user_profile is allowed to change
+_ALLOWED_PROFILE_FIELDS = frozenset(("display_name", "level", "reviews_completed"))
+
 class MySQLAuthManager:
     """
     Manager for MySQL-based authentication and user management.
@@ -39,9 +43,13 @@ class MySQLAuthManager:
         self.db = MySQLConnection()
         self._initialized = True
     
+    def _password_digest(self, password: str) -> bytes:
+        """Return the raw SHA-256 digest of a password."""
+        return hashlib.sha256(password.encode("utf-8")).digest()
+    
     def _hash_password(self, password: str) -> str:
-        """Hash a password using SHA-256."""
-        return hashlib.sha256(password.encode()).hexdigest()
+        """Hash a password using SHA-256 (hex-encoded for storage)."""
+        return self._password_digest(password).hex()
     
     def register_user(self, email: str, password: str, display_name: str, level: str = "basic") -> Dict[str, Any]:
         """Register a new user."""
@@ -84,19 +92,27 @@ class MySQLAuthManager:
     
     def authenticate_user(self, email: str, password: str) -> Dict[str, Any]:
         """Authenticate a user."""
-        # Hash the password for comparison
-        hashed_password = self._hash_password(password)
-        
-        # Query the database for the user
+        # Look the user up by email only so the query is a single probe of the
+        # UNIQUE email index, then compare the password hash in-process
         query = """
-            SELECT uid, email, display_name, level 
+            SELECT uid, email, display_name, level, password 
             FROM users 
-            WHERE email = %s AND password = %s
+            WHERE email = %s
         """
         
-        user = self.db.execute_query(query, (email, hashed_password), fetch_one=True)
+        # The row carries the password hash, so keep it out of the query cache
+        user = self.db.execute_query(query, (email,), fetch_one=True, cache=False)
         
-        if user:
+        # Compare the 32-byte digests rather than their 64-character hex forms;
+        # a stored value that is not valid hex (legacy or hand-inserted rows)
+        # is treated as a failed login
+        try:
+            password_ok = bool(user) and hmac.compare_digest(
+                bytes.fromhex(user["password"]), self._password_digest(password))
+        except ValueError:
+            password_ok = False
+        
+        if password_ok:
             logger.info(f"User authenticated: {email}")
             return {
                 "success": True,
@@ -134,9 +150,7 @@ class MySQLAuthManager:
     def update_user_profile(self, user_id: str, updates: Dict[str, Any]) -> Dict[str, Any]:
         """Update a user's profile."""
         # Ensure we don't update sensitive fields
-        safe_updates = {k: v for k, v in updates.items() if k in [
-            "display_name", "level", "reviews_completed"
-        ]}
+        safe_updates = {k: v for k, v in updates.items() if k in _ALLOWED_PROFILE_FIELDS}
         
         if not safe_updates:
             return {"success": True}  # Nothing to update
@@ -266,8 +280,10 @@ class MySQLAuthManager:
     
     def get_all_users(self) -> List[Dict[str, Any]]:
         """Get a list of all users."""
+        # Alias uid to user_id in SQL for consistency with the rest of the app,
+        # so rows come back ready to use without a per-row rename pass
         query = """
-            SELECT uid, email, display_name, level, created_at, reviews_completed
+            SELECT uid AS user_id, email, display_name, level, created_at, reviews_completed
             FROM users
         """
         
@@ -276,8 +292,4 @@ class MySQLAuthManager:
         if users is None:
             return []
         
-        # Rename uid to user_id for consistency with the rest of the app
-        for user in users:
-            user["user_id"] = user.pop("uid")
-        
         return users
\ No newline at end of file
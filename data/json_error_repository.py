@@ -48,6 +48,9 @@ class JsonErrorRepository:
         self.java_errors = {}
         self.java_error_categories = []
         
+        # Language-mapped error lists, filled lazily by get_category_errors
+        self._category_errors_cache: Dict[str, List[Dict[str, str]]] = {}
+        
         # Load error data from JSON files
         self.load_error_data()
     
@@ -58,6 +61,9 @@ class JsonErrorRepository:
         Returns:
             True if files are loaded successfully, False otherwise
         """
+        # Drop any mapped errors from previously loaded data
+        self._category_errors_cache = {}
+        
         java_loaded = self._load_java_errors()
         
         # If loading fails, try loading the English version as a fallback
@@ -166,6 +172,12 @@ class JsonErrorRepository:
         Returns:
             List of error dictionaries for the category
         """
+        # The loaded data does not change between reruns, so each category is
+        # mapped at most once
+        cached = self._category_errors_cache.get(category_name)
+        if cached is not None:
+            return cached
+        
         if category_name in self.java_errors:
             errors = self.java_errors[category_name]
             
@@ -179,6 +191,7 @@ class JsonErrorRepository:
             
             # Return the original list if no mapping needed
             if not needs_mapping:
+                self._category_errors_cache[category_name] = errors
                 return errors
             
             # Map field names for each error
@@ -197,7 +210,8 @@ class JsonErrorRepository:
                         mapped_error[key] = value
                         
                 mapped_errors.append(mapped_error)
-                
+            
+            self._category_errors_cache[category_name] = mapped_errors
             return mapped_errors
                 
         return []
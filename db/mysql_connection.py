@@ -1,7 +1,11 @@
 # db/mysql_connection.py
 import mysql.connector
+from mysql.connector import pooling
 import logging
 import time
+import threading
+from functools import lru_cache
+from cachetools import TTLCache
 from typing import Dict, Any, List, Optional, Tuple
 import os
 from dotenv import load_dotenv
@@ -17,6 +21,11 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=256)
+def _is_read_query(query: str) -> bool:
+    """Return True if the query returns rows (SELECT/SHOW), cached per SQL text."""
+    return query.lstrip().upper().startswith(("SELECT", "SHOW"))
+
 class MySQLConnection:
     """
     MySQL database connection manager for the Java Peer Review Training System.
@@ -42,38 +51,105 @@ class MySQLConnection:
         self.db_password = os.getenv("DB_PASSWORD", "selab")
         self.db_name = os.getenv("DB_NAME", "streamlit_app")
         self.db_port = int(os.getenv("DB_PORT", "3306"))
+        self.pool_size = int(os.getenv("DB_POOL_SIZE", "8"))
+        # Seconds to wait for a free pooled connection before giving up
+        self.pool_timeout = float(os.getenv("DB_POOL_TIMEOUT", "10"))
+        
+        # One slot per pooled connection; get_connection() fails at once when
+        # the pool is empty, so callers wait here for a connection to come back
+        self._pool_slots = threading.BoundedSemaphore(self.pool_size)
         
-        # Initialize connection to None
-        self.connection = None
+        # Initialize the connection pool to None
+        self._pool = None
+        
+        # Short-lived cache of single-row SELECT results, cleared on any write
+        self._query_cache = TTLCache(maxsize=1024, ttl=5.0)
+        self._query_cache_lock = threading.Lock()
+        # Bumped on every invalidation so a read that raced with a write does
+        # not store its (possibly stale) row after the cache was cleared
+        self._query_cache_generation = 0
         self._initialized = True
         
         # Create database and tables if they don't exist
         self._initialize_database()
+        
+        # Create the connection pool shared by all sessions
+        self._create_pool()
+    
+    def _create_pool(self):
+        """Create the connection pool, returning None if the server is unreachable."""
+        try:
+            # Add authentication_plugin parameter for compatibility
+            self._pool = pooling.MySQLConnectionPool(
+                pool_name="peerreview",
+                pool_size=self.pool_size,
+                pool_reset_session=False,
+                host=self.db_host,
+                user=self.db_user,
+                password=self.db_password,
+                database=self.db_name,
+                port=self.db_port,
+                auth_plugin='mysql_native_password',  # Try alternative auth method
+                use_pure=True  # Use pure Python implementation for better compatibility
+            )
+            logger.info(f"Created MySQL connection pool with {self.pool_size} connections")
+        except mysql.connector.Error as e:
+            logger.error(f"Error creating MySQL connection pool: {str(e)}")
+            logger.error(traceback.format_exc())
+            self._pool = None
+        return self._pool
     
     def _get_connection(self):
-        """Get a database connection with improved error handling."""
+        """
+        Get a pooled database connection with improved error handling.
+        
+        Waits up to pool_timeout seconds for a free connection when all of them
+        are in use. Every connection returned here must be handed back with
+        _release_connection.
+        """
+        if not self._pool_slots.acquire(timeout=self.pool_timeout):
+            logger.error(f"No free MySQL connection after waiting {self.pool_timeout}s")
+            return None
         try:
-            if self.connection is None or not self.connection.is_connected():
-                # Log connection attempt
-                #logger.info(f"Connecting to MySQL: {self.db_user}@{self.db_host}:{self.db_port}/{self.db_name}")
-                
-                # Add authentication_plugin parameter for compatibility
-                self.connection = mysql.connector.connect(
-                    host=self.db_host,
-                    user=self.db_user,
-                    password=self.db_password,
-                    database=self.db_name,
-                    port=self.db_port,
-                    auth_plugin='mysql_native_password',  # Try alternative auth method
-                    use_pure=True  # Use pure Python implementation for better compatibility
-                )
-                logger.info("Connected to MySQL successfully")
-            return self.connection
+            if self._pool is None and self._create_pool() is None:
+                self._pool_slots.release()
+                return None
+            # Connections that dropped while idle are reconnected by the pool
+            return self._pool.get_connection()
         except mysql.connector.Error as e:
+            self._pool_slots.release()
             logger.error(f"Error connecting to MySQL: {str(e)}")
             logger.error(traceback.format_exc())
             return None
     
+    def _release_connection(self, connection, cursor=None):
+        """
+        Close the cursor and return the connection to the pool.
+        
+        The connection is always closed (handed back to the pool) and its slot
+        released, even if the cursor or connection is already broken.
+        """
+        try:
+            if cursor is not None:
+                cursor.close()
+        except mysql.connector.Error:
+            pass
+        try:
+            # The pool does not reset sessions, so end any open transaction
+            # (e.g. the snapshot a SELECT started) before handing the
+            # connection back; otherwise later reads on it would see stale rows
+            if connection.in_transaction:
+                connection.rollback()
+        except mysql.connector.Error:
+            pass
+        finally:
+            try:
+                connection.close()
+            except mysql.connector.Error:
+                pass
+            finally:
+                self._pool_slots.release()
+    
     def _initialize_database(self):
         """Create the database and tables if they don't exist."""
         try:
@@ -95,17 +171,20 @@ class MySQLConnection:
             
             # Create users table if it doesn't exist - REMOVED average_accuracy column
             logger.info("Creating users table if not exists")
+            # email/display_name are capped at 191 characters so utf8mb4 keys
+            # stay within the 767-byte index limit of older InnoDB row formats
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS users (
                     uid VARCHAR(36) PRIMARY KEY,
-                    email VARCHAR(255) UNIQUE NOT NULL,
-                    display_name VARCHAR(255) NOT NULL,
+                    email VARCHAR(191) NOT NULL UNIQUE,
+                    display_name VARCHAR(191) NOT NULL,
                     password VARCHAR(255) NOT NULL,
                     level ENUM('basic', 'medium', 'senior') DEFAULT 'basic',
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                     reviews_completed INT DEFAULT 0,
-                    score INT DEFAULT 0
-                )
+                    score INT DEFAULT 0,
+                    INDEX idx_level (level)
+                ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci ROW_FORMAT=DYNAMIC
             """)
             
             # Commit changes and close connection
@@ -119,10 +198,34 @@ class MySQLConnection:
             logger.error(f"Error initializing database: {str(e)}")
             logger.error(traceback.format_exc())
     
-    def execute_query(self, query: str, params: tuple = None, fetch_one: bool = False):
+    def _invalidate_query_cache(self):
+        """Drop all cached SELECT results after a write."""
+        # Only the users table is read through the cache, so any write clears it
+        with self._query_cache_lock:
+            self._query_cache.clear()
+            self._query_cache_generation += 1
+    
+    def execute_query(self, query: str, params: tuple = None, fetch_one: bool = False,
+                      params_list: List[tuple] = None, cache: bool = True):
         """
         Execute a query and return the results.
+        
+        If params_list is given, the (non-SELECT) query is executed once per
+        parameter tuple with executemany and committed once for the whole batch.
+        Pass cache=False for single-row reads that must not be kept in the
+        process-wide cache (e.g. rows carrying password hashes).
         """
+        # Serve repeated single-row reads (e.g. profile lookups on every
+        # rerun) from the cache
+        cache_key = None
+        if cache and fetch_one and params_list is None and _is_read_query(query):
+            cache_key = (query, params)
+            with self._query_cache_lock:
+                cached = self._query_cache.get(cache_key)
+                generation = self._query_cache_generation
+            if cached is not None:
+                return dict(cached)
+        
         max_retries = 3
         retry_count = 0
         
@@ -134,29 +237,43 @@ class MySQLConnection:
                 retry_count += 1
                 continue
                 
+            cursor = None
             try:
-                cursor = connection.cursor(dictionary=True)
+                # Buffer results so a pooled connection is never handed back
+                # with unread rows (e.g. after fetch_one)
+                cursor = connection.cursor(dictionary=True, buffered=True)
                 
-                # Log query with parameters
-                if params:
-                    param_str = str(params)
-                   
+                # Log query with parameters (or the batch size for executemany)
+                if params_list is not None:
+                    logger.debug("Executing batch query: %s (%d parameter sets)", query, len(params_list))
                 else:
-                    logger.info(f"Executing query: {query}")
+                    logger.debug("Executing query: %s params=%s", query, params)
+                
+                if params_list is not None:
+                    # Batch path: the driver rewrites simple INSERTs into a
+                    # single multi-row statement, and everything commits once
+                    cursor.executemany(query, params_list)
+                    connection.commit()
+                    self._invalidate_query_cache()
+                    return cursor.rowcount
                 
                 cursor.execute(query, params or ())
                 
-                if query.strip().upper().startswith(("SELECT", "SHOW")):
+                if _is_read_query(query):
                     if fetch_one:
                         result = cursor.fetchone()
+                        if cache_key is not None and result is not None:
+                            with self._query_cache_lock:
+                                # Skip the store if a write invalidated the cache meanwhile
+                                if self._query_cache_generation == generation:
+                                    self._query_cache[cache_key] = dict(result)
                     else:
                         result = cursor.fetchall()
-                    cursor.close()
                     return result
                 else:
                     connection.commit()
                     affected_rows = cursor.rowcount
-                    cursor.close()                   
+                    self._invalidate_query_cache()
                     return affected_rows
             except mysql.connector.Error as e:
                 logger.error(traceback.format_exc())
@@ -165,7 +282,6 @@ class MySQLConnection:
                 should_retry = False
                 if "2006" in str(e) or "2013" in str(e):  # Common MySQL connection lost error codes
                     logger.info("Connection lost, attempting to reconnect...")
-                    self.connection = None  # Force reconnection
                     should_retry = True
                 
                 if should_retry and retry_count < max_retries - 1:
@@ -177,4 +293,7 @@ class MySQLConnection:
             except Exception as e:
                 logger.error(f"Unexpected error executing query: {str(e)}")
                 #logger.error(traceback.format_exc())
-                return None
\ No newline at end of file
+                return None
+            finally:
+                # Return the connection to the pool
+                self._release_connection(connection, cursor)
\ No newline at end of file
@@ -6,6 +6,7 @@ This package contains language modules for internationalization support.
 
 import importlib
 import logging
+from functools import lru_cache
 from typing import Dict, Any
 
 # Configure logging
@@ -20,10 +21,14 @@ SUPPORTED_LANGUAGES = {
 # Default language to use as fallback
 DEFAULT_LANGUAGE = "en"
 
+@lru_cache(maxsize=4)
 def get_language_module(lang_code: str):
     """
     Dynamically import and return the language module for the given language code.
     
+    Modules are only imported the first time their language is requested,
+    and the resolved module is cached per language code.
+    
     Args:
         lang_code: Language code (e.g., 'en', 'zh-tw')
         
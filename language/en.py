@@ -4,6 +4,9 @@ English translations for Java Peer Review Training System.
 This module provides English translations for the UI and system messages.
 """
 
+import sys
+from types import MappingProxyType
+
 # LLM instructions for responding in English
 llm_instructions = """
 Please respond in English. Use clear, concise language appropriate for programming education.
@@ -47,7 +50,6 @@ translations = {
     'select_ollama': 'Ollama will use locally hosted models running on your machine.',
     'ollama_error':'Cannot connect to Ollama: Failed to connect to Ollama at http://localhost:11434',
     'use_ollama':'Use Olama',
-    'connected_ollama':'Connected to Ollama',
     'groq_api_message':'Groq API uses cloud-hosted models and requires an API key',
     'groq_api_key':'Groq API Key ',
     'test_connection':'Test Connection',
@@ -59,9 +61,6 @@ translations = {
     'change_provider':'Change Provider',
     'provider':'Provider',
     'status':'Status',
-    'using_groq': 'Using Groq API (cloud)',
-    'connected_groq':'Connected to Groq API',
-    'connected':'Connected',
 
 
 
@@ -107,9 +106,7 @@ translations = {
     "workflow_not_initialized": "Workflow state not initialized. Please refresh the page.",
     "process_details": "Process Details",
     "no_process_details": "No process details available.",
-    "code_quality": "Code Quality",
     "found": "Found",
-    "of": "of",
     "requested_errors": "requested errors",
     "improving_code": "Improving code quality",
     "all_errors_implemented": "All requested errors successfully implemented!",
@@ -124,6 +121,8 @@ translations = {
     "selected": "Selected",
     "select": "Select",
     "remove": "Remove",
+    "apply_selection": "Apply Selection",
+    "page": "Page",
     "selected_issues": "Selected Issues",
     "no_specific_issues": "No specific issue selected. Random errors will be used based on categories.",
     'easy':'Easy',
@@ -165,11 +164,9 @@ translations = {
 
     # Feedback
     "educational_feedback": "Educational Feedback:",
-    "your_review": "Your Review:",
     "your_final_review": "Your Final Review (Attempt {iteration})",
     "issues_found": "Issues Found",
     "accuracy": "Accuracy",
-    "false_positives": "False Positives",
     "review_history": "Review History",
     "detailed_analysis": "Detailed Analysis",
     "identified_issues": "Identified Issues",
@@ -195,7 +192,6 @@ translations = {
     "error_generating_report": "There was an error generating a detailed comparison report.",
     "check_review_history": "Please check your review history for details",
     "preparing_update_stats": "Preparing to update stats",
-    "identified_count": "identified count",
     "successfully_updated_statistics": "Successfully updated user statistics",
     "statistics_updated": "Statistics updated",
     "to_your_score": "to your score",
@@ -330,4 +326,8 @@ translations = {
     "feedback": "Feedback",
     "review_summary": "Review Summary",
     "check_detailed_analysis": "Check the detailed analysis in the comparison report for more information."
-}
\ No newline at end of file
+}
+
+# Freeze the table: translations are read on every render and must never be
+# mutated at runtime; interned keys let lookups short-circuit on identity
+translations = MappingProxyType({sys.intern(k): v for k, v in translations.items()})
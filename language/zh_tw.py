@@ -4,6 +4,9 @@ Traditional Chinese (zh-tw) translations for Java Peer Review Training System.
 This module provides Traditional Chinese translations for the UI and system messages.
 """
 
+import sys
+from types import MappingProxyType
+
 # LLM instructions for responding in Traditional Chinese
 llm_instructions = """
 請用繁體中文回答。使用清晰、簡潔的語言，適合程式設計教育。
@@ -46,7 +49,6 @@ translations = {
     'select_ollama': 'Ollama 將使用在您本機上運行的本地託管模型',
     'ollama_error':'無法連線到 Ollama：在 http://localhost:11434 連接失敗',
     'use_ollama':'使用 Ollama',
-    'connected_ollama':'已連線到 Ollama',
     'groq_api_message':'Groq API 使用雲端託管的模型，並且需要 API 金鑰',
     'groq_api_key':'Groq API 金鑰',
     'test_connection':'測試連線',
@@ -58,9 +60,6 @@ translations = {
     'change_provider': '變更提供者',
     'provider':'提供者',
     'status':'狀態',
-    'using_groq': '使用 Groq API（雲端）',
-    'connected_groq':'已連線至 Groq API',
-    'connected':'已連線到',
 
 
     # Code Generation
@@ -105,9 +104,7 @@ translations = {
     "workflow_not_initialized": "工作流程狀態未初始化。請刷新頁面。",
     "process_details": "過程詳情",
     "no_process_details": "沒有可用的過程詳情。",
-    "code_quality": "程式碼品質",
     "found": "找到",
-    "of": "共",
     "requested_errors": "請求的錯誤",
     "improving_code": "改進程式碼品質",
     "all_errors_implemented": "所有請求的錯誤都已成功實現！",
@@ -122,6 +119,8 @@ translations = {
     "selected": "已選擇",
     "select": "選擇",
     "remove": "移除",
+    "apply_selection": "套用選擇",
+    "page": "頁",
     "selected_issues": "已選擇的問題",
     "no_specific_issues": "未選擇特定問題。將根據類別使用隨機錯誤。",
     'easy':'簡單的',
@@ -164,11 +163,9 @@ translations = {
     
     # Feedback
     "educational_feedback": "教育性反饋：",
-    "your_review": "您的審查：",
     "your_final_review": "您的最終審查（嘗試 {iteration}）",
     "issues_found": "找到的問題",
     "accuracy": "準確率",
-    "false_positives": "誤報",
     "review_history": "審查歷史",
     "detailed_analysis": "詳細分析",
     "identified_issues": "已識別的問題",
@@ -194,7 +191,6 @@ translations = {
     "error_generating_report": "生成詳細比較報告時出錯。",
     "check_review_history": "請檢查您的審查歷史以獲取詳細信息",
     "preparing_update_stats": "準備更新統計數據",
-    "identified_count": "已識別數量",
     "successfully_updated_statistics": "成功更新用戶統計數據",
     "statistics_updated": "統計數據已更新",
     "to_your_score": "到您的分數",
@@ -331,4 +327,8 @@ translations = {
     "review_summary": "審查摘要",
     "check_detailed_analysis": "請查看比較報告中的詳細分析以獲取更多信息。" 
 
-}
\ No newline at end of file
+}
+
+# Freeze the table: translations are read on every render and must never be
+# mutated at runtime; interned keys let lookups short-circuit on identity
+translations = MappingProxyType({sys.intern(k): v for k, v in translations.items()})
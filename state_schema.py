@@ -61,6 +61,7 @@ class WorkflowState(BaseModel):
     
     # Analysis results
     review_sufficient: bool = Field(False, description="Whether the review is sufficient")
+    review_completed: bool = Field(False, description="Whether the review process has finished; set once and never cleared")
     review_summary: Optional[str] = Field(None, description="Final review summary")
     comparison_report: Optional[str] = Field(None, description="Comparison report")
     
@@ -1,4 +1,3 @@
-# First, update the imports at the top:
 import streamlit as st
 import logging
 import time
@@ -8,9 +7,30 @@ from pathlib import Path
 import base64
 
 from auth.mysql_auth import MySQLAuthManager
-from utils.language_utils import t, get_current_language, get_field_value  # Add get_field_value
+from utils.language_utils import get_translator
+
+# Logging is configured once by the app entry point; messages use lazy
+# %-formatting so nothing is built when INFO is filtered out
+logger = logging.getLogger(__name__)
+
+# Seconds a user profile fetched from the database is reused across reruns
+PROFILE_CACHE_TTL = 30
+
+# Display names for the user levels stored in the database
+LEVEL_DISPLAY = {"basic": "Basic", "medium": "Medium", "senior": "Senior"}
+
+# Sidebar profile stats block, filled in with str.format_map on each render
+PROFILE_STATS_TMPL = """
+<div class="profile-item">
+    <span class="profile-label">{review_times_label}:</span>
+    <span class="profile-value">{reviews}</span>
+</div>
+<div class="profile-item">
+    <span class="profile-label">{score_label}:</span>
+    <span class="profile-value">{score}</span>
+</div>
+"""
 
-# Then update the authentication methods:
 class AuthUI:
     """
     UI Component for user authentication and profile management.
@@ -22,6 +42,10 @@ class AuthUI:
         """Initialize the AuthUI component with local auth manager."""
         self.auth_manager = MySQLAuthManager()
         
+        # Sidebar placeholder holding the profile stats for this run, so they
+        # can be redrawn in place when update_review_stats changes them
+        self._stats_slot = None
+        
         # Initialize session state for authentication
         if "auth" not in st.session_state:
             st.session_state.auth = {
@@ -30,6 +54,56 @@ class AuthUI:
                 "user_info": {}
             }
     
+    def is_authenticated(self) -> bool:
+        """
+        Check if the current session has a logged-in user.
+        
+        Returns:
+            bool: True if user is authenticated, False otherwise
+        """
+        return st.session_state.auth.get("is_authenticated", False)
+    
+    def _get_profile(self, user_id: str) -> Dict[str, Any]:
+        """
+        Get the user's profile, reusing a recent copy from session state.
+        
+        Args:
+            user_id: The user's ID
+            
+        Returns:
+            Profile dictionary as returned by the auth manager
+        """
+        auth = st.session_state.auth
+        cached = auth.get("profile_cache")
+        now = time.time()
+        if cached and cached["user_id"] == user_id and now - cached["fetched_at"] < PROFILE_CACHE_TTL:
+            return cached["profile"]
+        
+        profile = self.auth_manager.get_user_profile(user_id)
+        if profile.get("success", False):
+            auth["profile_cache"] = {"user_id": user_id, "fetched_at": now, "profile": profile}
+        return profile
+    
+    def _authenticated_state(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the session auth state for a successful login or registration.
+        
+        Args:
+            result: Result dictionary from the auth manager
+            
+        Returns:
+            New value for st.session_state.auth
+        """
+        return {
+            "is_authenticated": True,
+            "user_id": result.get("user_id"),
+            "user_info": {
+                "display_name": result.get("display_name"),
+                "email": result.get("email"),
+                "level": result.get("level", "basic")
+            }
+        }
+    
     def render_auth_page(self) -> bool:
         """
         Render the authentication page with login and registration forms.
@@ -37,39 +111,36 @@ class AuthUI:
         Returns:
             bool: True if user is authenticated, False otherwise
         """
+        # Resolve the current language once for all labels on this page
+        tr = get_translator()
+        
         # Existing implementation...
         
-        # For login functionality, update with get_field_value:
-        if st.button(t("login"), use_container_width=True, key="login_button"):
+        # For login functionality:
+        if st.button(tr("login"), use_container_width=True, key="login_button"):
             if not email or not password:
-                st.error(t("fill_all_fields"))
+                st.error(tr("fill_all_fields"))
             else:
                 # Authenticate user
                 result = self.auth_manager.authenticate_user(email, password)
                 
-                if get_field_value(result, "success", False):
-                    # Set authenticated state
-                    st.session_state.auth["is_authenticated"] = True
-                    st.session_state.auth["user_id"] = get_field_value(result, "user_id")
-                    st.session_state.auth["user_info"] = {
-                        "display_name": get_field_value(result, "display_name"),
-                        "email": get_field_value(result, "email"),
-                        "level": get_field_value(result, "level", "basic")
-                    }                     
-                    st.success(t("login") + " " + t("login_failed"))
+                if result.get("success", False):
+                    # Set authenticated state with a single session-state write
+                    st.session_state.auth = self._authenticated_state(result)
+                    st.success(tr("login") + " " + tr("login_failed"))
                     
                     # Force UI refresh
                     st.rerun()
                 else:
-                    st.error(f"{t('login_failed')}: {get_field_value(result, 'error', t('invalid_credentials'))}")
+                    st.error(f"{tr('login_failed')}: {result.get('error', tr('invalid_credentials'))}")
         
-        # For registration, update similarly:
-        if st.button(t("register"), use_container_width=True, key="register_button"):
+        # For registration:
+        if st.button(tr("register"), use_container_width=True, key="register_button"):
             # Validate inputs
             if not display_name or not email or not password or not confirm_password:
-                st.error(t("fill_all_fields"))
+                st.error(tr("fill_all_fields"))
             elif password != confirm_password:
-                st.error(t("passwords_mismatch"))
+                st.error(tr("passwords_mismatch"))
             else:
                 # Register user
                 result = self.auth_manager.register_user(
@@ -79,107 +150,125 @@ class AuthUI:
                     level=level.lower()
                 )
                 
-                if get_field_value(result, "success", False):
-                    # Set authenticated state
-                    st.session_state.auth["is_authenticated"] = True
-                    st.session_state.auth["user_id"] = get_field_value(result, "user_id")
-                    st.session_state.auth["user_info"] = {
-                        "display_name": get_field_value(result, "display_name"),
-                        "email": get_field_value(result, "email"),
-                        "level": get_field_value(result, "level", "basic")
-                    }
-                    st.success(t("registration_failed"))
+                if result.get("success", False):
+                    # Set authenticated state with a single session-state write
+                    st.session_state.auth = self._authenticated_state(result)
+                    st.success(tr("registration_failed"))
                     
                     # Force UI refresh
                     st.rerun()
                 else:
-                    st.error(f"{t('registration_failed')}: {get_field_value(result, 'error', t('email_in_use'))}")
+                    st.error(f"{tr('registration_failed')}: {result.get('error', tr('email_in_use'))}")
 
-    # Update render_user_profile method
     def render_user_profile(self):
         """Render the user profile section in the sidebar."""
+        # Bind the auth state once; each st.session_state access goes through
+        # Streamlit's session proxy
+        auth = st.session_state.auth
+        
         # Check if user is authenticated
-        if not st.session_state.auth.get("is_authenticated", False):
+        if not auth.get("is_authenticated", False):
             return
+        
+        # Resolve the current language once for all labels in the profile
+        tr = get_translator()
             
         # Get user info
-        user_info = st.session_state.auth.get("user_info", {})
-        display_name = get_field_value(user_info, "display_name", "User")
-        level = get_field_value(user_info, "level", "basic").capitalize()     
+        user_info = auth.get("user_info", {})
+        display_name = user_info.get("display_name", "User")
+        level = LEVEL_DISPLAY.get(user_info.get("level", "basic"), "Basic")     
         
         # Add styled profile section...
         
         # Get extended profile from database if user is not demo user
-        if st.session_state.auth.get("user_id") != "demo-user":
-            user_id = st.session_state.auth.get("user_id")
+        user_id = auth.get("user_id")
+        if user_id != "demo-user":
+            self._stats_slot = st.sidebar.empty()
             try:
-                profile = self.auth_manager.get_user_profile(user_id)
-                if get_field_value(profile, "success", False):
-                    # Display additional stats
-                    reviews = get_field_value(profile, "reviews_completed", 0)
-                    score = get_field_value(profile, "score", 0)                   
-                    st.sidebar.markdown(f"""
-                    <div class="profile-item">
-                        <span class="profile-label">{t("review_times")}:</span>
-                        <span class="profile-value">{reviews}</span>
-                    </div>
-                    <div class="profile-item">
-                        <span class="profile-label">{t("score")}:</span>
-                        <span class="profile-value">{score}</span>
-                    </div>
-                    """, unsafe_allow_html=True)   
+                profile = self._get_profile(user_id)
+                if profile.get("success", False):
+                    self._render_profile_stats(profile, tr)
             except Exception as e:
-                logger.error(f"Error getting user profile: {str(e)}")
+                logger.error("Error getting user profile: %s", e)
+    
+    def _render_profile_stats(self, profile: Dict[str, Any], tr: Callable[[str], str]) -> None:
+        """
+        Draw the review count and score into the sidebar stats placeholder.
+        
+        Args:
+            profile: User profile with reviews_completed and score
+            tr: Translator bound to the current language
+        """
+        self._stats_slot.markdown(PROFILE_STATS_TMPL.format_map({
+            "review_times_label": tr("review_times"),
+            "reviews": profile.get("reviews_completed", 0),
+            "score_label": tr("score"),
+            "score": profile.get("score", 0)
+        }), unsafe_allow_html=True)
 
-    # Update update_review_stats method
     def update_review_stats(self, accuracy: float, score: int = 0):
         """
         Update a user's review statistics after completing a review.
         
         Args:
             accuracy: The accuracy of the review (0-100 percentage)
-            score: Number of errors detected in the review
+            score: Number of errors detected in the review; callers pass an int
         """
+        auth = st.session_state.auth
+        
         # Check if user is authenticated
-        if not st.session_state.auth.get("is_authenticated", False):
+        if not auth.get("is_authenticated", False):
             return {"success": False, "error": "User not authenticated"}
                 
         # Skip for demo user
-        if st.session_state.auth.get("user_id") == "demo-user":
+        user_id = auth.get("user_id")
+        if user_id == "demo-user":
             return {"success": True, "message": "Demo user - no updates needed"}
-                
-        # Update stats in the database
-        user_id = st.session_state.auth.get("user_id")
-        
-        # Ensure score is an integer
-        score = int(score) if score else 0
         
         # Add debug logging
-        logger.info(f"AuthUI: Updating stats for user {user_id}: accuracy={accuracy:.1f}%, score={score}")
+        logger.info("AuthUI: Updating stats for user %s: accuracy=%.1f%%, score=%d", user_id, accuracy, score)
         
         # IMPORTANT: Pass both accuracy AND score parameters to the auth manager
         result = self.auth_manager.update_review_stats(user_id, accuracy, score)
 
-        if result and get_field_value(result, "success", False):
-            logger.info(f"Updated user statistics: reviews={get_field_value(result, 'reviews_completed')}, " +
-                    f"score={get_field_value(result, 'score')}")
+        if result and result.get("success", False):
+            logger.info("Updated user statistics: reviews=%s, score=%s",
+                        result.get('reviews_completed'), result.get('score'))
+            
+            # Refresh the cached profile with the new stats instead of refetching it
+            cached = auth.get("profile_cache")
+            if cached and cached["user_id"] == user_id:
+                profile = dict(cached["profile"])
+                profile["reviews_completed"] = result.get("reviews_completed", profile.get("reviews_completed", 0))
+                profile["score"] = result.get("score", profile.get("score", 0))
+                if result.get("level_changed", False):
+                    profile["level"] = result.get("new_level", profile.get("level"))
+                auth["profile_cache"] = {"user_id": user_id, "fetched_at": time.time(), "profile": profile}
+                
+                # Redraw the sidebar stats already rendered in this run
+                if self._stats_slot is not None:
+                    self._render_profile_stats(profile, get_translator())
             
             # Update session state if level changed
-            if get_field_value(result, "level_changed", False):
-                new_level = get_field_value(result, "new_level")
-                if new_level and st.session_state.auth.get("user_info"):
-                    st.session_state.auth["user_info"]["level"] = new_level
-                    logger.info(f"Updated user level in session to: {new_level}")
+            if result.get("level_changed", False):
+                new_level = result.get("new_level")
+                if new_level and auth.get("user_info"):
+                    auth["user_info"]["level"] = new_level
+                    logger.info("Updated user level in session to: %s", new_level)
+                # Have get_user_level confirm the new level against the database once
+                auth["level_dirty"] = True
         else:
-            err_msg = get_field_value(result, 'error', 'Unknown error') if result else "No result returned"
-            logger.error(f"Failed to update review stats: {err_msg}")
+            err_msg = result.get('error', 'Unknown error') if result else "No result returned"
+            logger.error("Failed to update review stats: %s", err_msg)
         
         return result
 
-    # Update get_user_level method
     def get_user_level(self) -> str:
         """
-        Get the user's level directly from the database.
+        Get the user's level.
+        
+        The level stored in session state at login is trusted; the database is
+        only queried after update_review_stats reports a level change.
         
         Returns:
             str: User's level (basic, medium, senior) or None if not authenticated
@@ -187,23 +276,25 @@ class AuthUI:
         if not self.is_authenticated():
             return None
         
-        user_id = st.session_state.auth.get("user_id")
+        auth = st.session_state.auth
+        user_id = auth.get("user_id")
         # Skip database query for demo users
-        if user_id == "demo-user":
-            return get_field_value(st.session_state.auth.get("user_info", {}), "level", "basic")
-            
+        if user_id == "demo-user" or not auth.get("level_dirty", False):
+            return auth.get("user_info", {}).get("level", "basic")
+        
+        auth["level_dirty"] = False
         try:
             # Query the database for the latest user info
             profile = self.auth_manager.get_user_profile(user_id)
-            if get_field_value(profile, "success", False):
+            if profile.get("success", False):
                 # Update the session state with the latest level
-                level = get_field_value(profile, "level", "basic")
-                st.session_state.auth["user_info"]["level"] = level
+                level = profile.get("level", "basic")
+                auth["user_info"]["level"] = level
                 return level
             else:
                 # Fallback to session state if query fails
-                return get_field_value(st.session_state.auth.get("user_info", {}), "level", "basic")
+                return auth.get("user_info", {}).get("level", "basic")
         except Exception as e:
-            logger.error(f"Error getting user level from database: {str(e)}")
+            logger.error("Error getting user level from database: %s", e)
             # Fallback to session state
-            return get_field_value(st.session_state.auth.get("user_info", {}), "level", "basic")
\ No newline at end of file
+            return auth.get("user_info", {}).get("level", "basic")
\ No newline at end of file
@@ -8,16 +8,82 @@ to include in the generated code problems.
 import streamlit as st
 import logging
 import random
+from functools import lru_cache
 from typing import List, Dict, Any, Optional, Tuple, Callable
-from utils.language_utils import t, get_field_value, get_state_attribute
+from utils.language_utils import t, get_field_value, get_state_attribute, get_current_language
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Logging is configured once by the app entry point (app.py)
 logger = logging.getLogger(__name__)
 
+# Icon shown for each error category, in both languages
+_CATEGORY_ICONS = {
+    "Logical": "🧠",
+    "Syntax": "🔍",
+    "Code Quality": "✨",
+    "Standard Violation": "📏",
+    "Java Specific": "☕",
+    # Chinese category mappings
+    "邏輯錯誤": "🧠",
+    "語法錯誤": "🔍",
+    "程式碼品質": "✨",
+    "標準違規": "📏",
+    "Java 特定錯誤": "☕"
+}
+
+# Used for categories that have no entry above
+_DEFAULT_ICON = "📁"
+
+# Error selection modes, in the order they are offered
+_MODES = ("advanced", "specific")
+
+# Number of errors shown per page in the specific error selection
+PAGE_SIZE = 25
+
+def _error_checkbox_key(error_key: Tuple[str, str]) -> str:
+    """
+    Build the session state key of an error's select checkbox.
+    
+    The key is derived from (category, error name) rather than loop indices,
+    so other callbacks can find the checkbox of a given error.
+    
+    Args:
+        error_key: Tuple of (category, error name)
+        
+    Returns:
+        Widget key of the checkbox
+    """
+    return f"select_{error_key[0]}_{error_key[1]}"
+
+@lru_cache(maxsize=16)
+def _code_params_for(normalized_level: str, lang: str) -> Tuple[str, str]:
+    """
+    Resolve the translated difficulty and code length for a user level.
+    
+    Args:
+        normalized_level: Lowercase user level ("basic", "medium" or "senior")
+        lang: Language code the values are translated into
+        
+    Returns:
+        Tuple of (difficulty_level, code_length)
+    """
+    # Set appropriate difficulty based on normalized user level
+    difficulty_mapping = {
+        "basic": t("easy"),
+        "medium": t("medium"),
+        "senior": t("hard")
+    }
+    difficulty_level = difficulty_mapping.get(normalized_level, "medium")
+    
+    # Set code length based on difficulty
+    length_mapping = {
+        t("easy"): t("short"),
+        t("medium"): t("medium"),
+        t("hard"): t("long")
+    }
+    code_length = length_mapping.get(difficulty_level, "medium")
+    
+    return difficulty_level, code_length
+
 class ErrorSelectorUI:
     """
     UI Component for selecting Java error categories.
@@ -28,31 +94,18 @@ class ErrorSelectorUI:
     
     def __init__(self):
         """Initialize the ErrorSelectorUI component with empty selections."""
-        # Track selected categories - initialize with empty collections if not in session state
-        if "selected_error_categories" not in st.session_state:
-            st.session_state.selected_error_categories = {
-               "java_errors": []
-            }
-        elif not isinstance(st.session_state.selected_error_categories, dict):
-            # Fix if it's not a proper dictionary
-            st.session_state.selected_error_categories = {
-                "java_errors": []
-            }
-        elif "java_errors" not in st.session_state.selected_error_categories:
-            # Make sure java_errors key exists
-            st.session_state.selected_error_categories["java_errors"] = []
-        
-        # Track error selection mode
-        if "error_selection_mode" not in st.session_state:
-            st.session_state.error_selection_mode = "advanced"
-        
-        # Track expanded categories
-        if "expanded_categories" not in st.session_state:
-            st.session_state.expanded_categories = {}
-            
-        # Track selected specific errors - initialize as empty list
-        if "selected_specific_errors" not in st.session_state:
-            st.session_state.selected_specific_errors = []
+        ss = st.session_state
+        
+        # Track selected categories - reset if a previous run stored something other than a dict
+        ss.setdefault("selected_error_categories", {"java_errors": []})
+        if not isinstance(ss.selected_error_categories, dict):
+            ss.selected_error_categories = {"java_errors": []}
+        ss.selected_error_categories.setdefault("java_errors", [])
+        
+        # Track error selection mode, expanded categories and selected specific errors
+        ss.setdefault("error_selection_mode", "advanced")
+        ss.setdefault("expanded_categories", {})
+        ss.setdefault("selected_specific_errors", [])
     
     def render_category_selection(self, all_categories: Dict[str, List[str]]) -> Dict[str, List[str]]:
         """
@@ -73,137 +126,69 @@ class ErrorSelectorUI:
         
         java_error_categories = get_field_value(all_categories, "java_errors", [])
         
-        # Ensure the session state structure is correct
-        if "selected_error_categories" not in st.session_state:
-            st.session_state.selected_error_categories = {"java_errors": []}
-        if "java_errors" not in st.session_state.selected_error_categories:
-            st.session_state.selected_error_categories["java_errors"] = []
-        
         # Get the current selection state from session
         current_selections = get_field_value(st.session_state.selected_error_categories, "java_errors", [])
         
-        # Use a card-based grid layout for categories
-        st.markdown('<div class="problem-area-grid">', unsafe_allow_html=True)
-        
-        # Define category icons and descriptions for better visual appeal
-        category_info = {
-            "Logical": {
-                "icon": "🧠",
-                "description": t("logical_desc")
-            },
-            "Syntax": {
-                "icon": "🔍",
-                "description": t("syntax_desc")
-            },
-            "Code Quality": {
-                "icon": "✨",
-                "description": t("code_quality_desc")
-            },
-            "Standard Violation": {
-                "icon": "📏",
-                "description": t("standard_violation_desc")
-            },
-            "Java Specific": {
-                "icon": "☕",
-                "description": t("java_specific_desc")
-            },
-            # Chinese category mappings
-            "邏輯錯誤": {
-                "icon": "🧠",
-                "description": t("logical_desc")
-            },
-            "語法錯誤": {
-                "icon": "🔍",
-                "description": t("syntax_desc")
-            },
-            "程式碼品質": {
-                "icon": "✨",
-                "description": t("code_quality_desc")
-            },
-            "標準違規": {
-                "icon": "📏",
-                "description": t("standard_violation_desc")
-            },
-            "Java 特定錯誤": {
-                "icon": "☕",
-                "description": t("java_specific_desc")
-            }
-        }
-        
-        # Generate cards for each category
-        for i, category in enumerate(java_error_categories):
-            # Create a unique and safe key for this category
-            category_key = f"java_category_{i}"
-            
-            # Check if category is already selected from session state
-            is_selected = category in current_selections
-            
-            # Get icon and description - fallback to defaults if not found
-            icon = get_field_value(get_field_value(category_info, category, {}), "icon", "📁")
-            description = get_field_value(get_field_value(category_info, category, {}), "description", t("error_category"))
-            
+        def category_label(category: str) -> str:
             # Get translated category name - if it's already in the correct language, this will just return the original
-            category_name = t(category.lower()) if category.lower() in ["logical", "syntax", "code_quality", "standard_violation", "java_specific"] else category
-            
-            # Create a card with toggle effect for each category
-            selected_class = "selected" if is_selected else ""
-            st.markdown(f"""
-            <div class="problem-area-card {selected_class}" id="{category_key}_card" 
-                onclick="this.classList.toggle('selected'); 
-                        document.getElementById('{category_key}_checkbox').click();">
-                <div class="problem-area-title">
-                    {icon} {category_name}
-                    <span class="icon">{'✓' if is_selected else ''}</span>
-                </div>
-                <p class="problem-area-description">{description}</p>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            # Hidden checkbox to track state (will be clicked by the card's onclick handler)
-            # Use index-based unique keys instead of category text
-            selected = st.checkbox(
-                f"Category {i}",  # Just a label, won't be displayed
-                key=category_key,
-                value=is_selected,
-                label_visibility="collapsed"  # Hide the actual checkbox
-            )
-            
-            # Update selection state based on checkbox
-            if selected:
-                if category not in current_selections:
-                    current_selections.append(category)
-            else:
-                if category in current_selections:
-                    current_selections.remove(category)
-        
-        # Close the grid container
-        st.markdown('</div>', unsafe_allow_html=True)
+            return t(category.lower()) if category.lower() in ["logical", "syntax", "code_quality", "standard_violation", "java_specific"] else category
+        
+        # Seed the pills from the stored selection the first time it is shown
+        # (or after a language switch changed the category names); afterwards its
+        # session state entry is the source of truth
+        stored = st.session_state.get("java_category_pills")
+        if stored is None or any(c not in java_error_categories for c in stored):
+            st.session_state.java_category_pills = [
+                c for c in (stored if stored is not None else current_selections) if c in java_error_categories
+            ]
+            self._sync_selected_categories(java_error_categories)
+        
+        # Native multi-select pills replace the HTML card grid: one widget, one
+        # state entry and a single rerun per toggle. The callback writes the
+        # stored selection, so no mirroring is needed here
+        st.pills(
+            t("select_error_categories"),
+            options=java_error_categories,
+            selection_mode="multi",
+            format_func=lambda c: f"{_CATEGORY_ICONS.get(c, _DEFAULT_ICON)} {category_label(c)}",
+            key="java_category_pills",
+            on_change=self._sync_selected_categories,
+            args=(java_error_categories,),
+            label_visibility="collapsed"
+        )
+        current_selections = st.session_state.selected_error_categories["java_errors"]
         
         # Selection summary
         st.write("### " + t("selected_categories"))
         if not current_selections:
             st.warning(t("no_categories"))
         else:
-            # Display selected categories with visual enhancements
-            st.markdown('<div class="selected-categories">', unsafe_allow_html=True)
-            for i, category in enumerate(current_selections):
-                icon = get_field_value(get_field_value(category_info, category, {}), "icon", "📁")
-                category_name = t(category.lower()) if category.lower() in ["logical", "syntax", "code_quality", "standard_violation", "java_specific"] else category
-                
-                # Use index-based unique identifier for each category display
-                st.markdown(f"""
-                <div class="selected-category-item" id="selected_category_{i}">
-                    <span class="category-icon">{icon}</span>
-                    <span class="category-name">{category_name}</span>
-                </div>
-                """, unsafe_allow_html=True)
-            st.markdown('</div>', unsafe_allow_html=True)
-        
-        # Update selections in session state
-        st.session_state.selected_error_categories["java_errors"] = current_selections
+            # Display selected categories as colored labels, joined into a single
+            # markdown element instead of one element per category; plain colored
+            # text has no badge background, so separate the labels explicitly
+            st.markdown(" · ".join(
+                f":blue[**{_CATEGORY_ICONS.get(category, _DEFAULT_ICON)} {category_label(category)}**]"
+                for category in current_selections
+            ))
         
         return st.session_state.selected_error_categories
     
+    @staticmethod
+    def _sync_selected_categories(java_error_categories: List[str]) -> None:
+        """
+        Store the category pills value as the selected categories.
+        
+        Used as the category pills callback; the selection is kept in
+        catalog order regardless of click order.
+        
+        Args:
+            java_error_categories: All categories in catalog order
+        """
+        selected_set = set(st.session_state.java_category_pills)
+        st.session_state.selected_error_categories["java_errors"] = [
+            c for c in java_error_categories if c in selected_set
+        ]
+    
     def render_specific_error_selection(self, error_repository) -> List[Dict[str, Any]]:
         """
         Render UI for selecting specific errors to include in generated code.
@@ -217,66 +202,115 @@ class ErrorSelectorUI:
         """
         st.subheader(t("select_specific_errors"))
         
+        self._specific_error_fragment(error_repository)
+        
+        return st.session_state.selected_specific_errors
+    
+    @st.fragment
+    def _specific_error_fragment(self, error_repository) -> None:
+        """
+        Render the specific error tabs and the selected issues list.
+        
+        Runs as a fragment so applying or removing selections only reruns
+        this part of the page instead of the whole app.
+        
+        Args:
+            error_repository: Repository for accessing Java error data
+        """
         # Get all categories
         all_categories = error_repository.get_all_categories()
         java_error_categories = get_field_value(all_categories, "java_errors", [])
         
-        # Container for selected errors
-        if "selected_specific_errors" not in st.session_state:
-            st.session_state.selected_specific_errors = []
-            
         # Check if there are any categories to display
         if not java_error_categories:
             st.warning("No error categories found. Please check that the error repository is properly configured.")
-            return st.session_state.selected_specific_errors
+            return
             
-        # Create tabs for each error category
-        error_tabs = st.tabs(java_error_categories)
-
-        # For each category tab
-        for i, category in enumerate(java_error_categories):
-            with error_tabs[i]:
-                # Get errors for this category
-                errors = error_repository.get_category_errors(category)
-                if not errors:
-                    st.info(f"{t('no_errors_found')} {category} {t('category')}.")
-                    continue
-                    
-                # Display each error with a select button
-                for j, error in enumerate(errors):
-                    # Handle potential missing field names using get_field_value
-                    error_name = get_field_value(error, "error_name", "Unknown")
-                    description = get_field_value(error, "description", "")
-                    
-                    # Check if already selected
-                    is_selected = any(
-                        get_field_value(e, "name", "") == error_name and get_field_value(e, "category", "") == category
-                        for e in st.session_state.selected_specific_errors
-                    )
-                    
-                    # Add select button with an index to ensure unique keys
-                    col1, col2 = st.columns([5, 1])
-                    with col1:
-                        st.markdown(f"**{error_name}**")
-                        st.markdown(f"*{description}*")
-                    with col2:
-                        if not is_selected:
-                            # Add indices to ensure key uniqueness
-                            unique_key = f"select_{i}_{j}_{category}"
-                            if st.button(t("select"), key=unique_key):
-                                st.session_state.selected_specific_errors.append({
-                                    "type": "java_error",
-                                    "category": category,
-                                    "name": error_name,
-                                    "description": description,
-                                    "implementation_guide": get_field_value(error, "implementation_guide", "")
-                                })
-                                st.rerun()
-                        else:
-                            # Just display "Selected" text without a button
-                            st.success(t("selected"))
-                    
-                    st.markdown("---")
+        # Keys of the errors that are currently selected
+        selected_keys = [
+            (get_field_value(e, "category", ""), get_field_value(e, "name", ""))
+            for e in st.session_state.selected_specific_errors
+        ]
+        # Hashed index for the per-row "is selected" checks
+        selected_index = frozenset(selected_keys)
+        
+        # Only the active category is rendered; a radio bar stands in for tabs
+        # because st.tabs builds the contents of every tab on each run
+        if st.session_state.get("active_error_tab") not in java_error_categories:
+            st.session_state.active_error_tab = java_error_categories[0]
+        category = st.radio(
+            t("category"),
+            options=java_error_categories,
+            key="active_error_tab",
+            horizontal=True,
+            label_visibility="collapsed"
+        )
+        # Get errors for the active category
+        errors = error_repository.get_category_errors(category)
+        
+        # Large categories are shown one page at a time. Each category keeps
+        # its own page number in a plain session state dict, because the page
+        # widget of an inactive category is not rendered and Streamlit drops
+        # its widget state
+        offset = 0
+        if len(errors) > PAGE_SIZE:
+            page_count = (len(errors) + PAGE_SIZE - 1) // PAGE_SIZE
+            error_pages = st.session_state.setdefault("error_pages", {})
+            page_key = f"error_page_{category}"
+            page = st.number_input(
+                t("page"),
+                min_value=1,
+                max_value=page_count,
+                value=min(error_pages.get(category, 1), page_count),
+                step=1,
+                key=page_key,
+                on_change=self._store_error_page,
+                args=(category, page_key)
+            )
+            offset = (page - 1) * PAGE_SIZE
+        page_errors = errors[offset:offset + PAGE_SIZE]
+        
+        # Collect the choices in a form so that ticking several errors costs a
+        # single rerun when the selection is applied
+        checked_errors = {}
+        visible_keys = set()
+        with st.form("specific_errors_form"):
+            if not errors:
+                st.info(f"{t('no_errors_found')} {category} {t('category')}.")
+                
+            # Display each error on the current page with a select checkbox
+            for error in page_errors:
+                # Handle potential missing field names using get_field_value
+                error_name = get_field_value(error, "error_name", "Unknown")
+                description = get_field_value(error, "description", "")
+                visible_keys.add((category, error_name))
+                
+                # Check if already selected
+                is_selected = (category, error_name) in selected_index
+                
+                # The checkbox label carries the error name, so each row needs no
+                # column layout: one checkbox plus its description caption
+                if st.checkbox(f"**{error_name}**", value=is_selected, key=_error_checkbox_key((category, error_name))):
+                    checked_errors[(category, error_name)] = {
+                        "type": "java_error",
+                        "category": category,
+                        "name": error_name,
+                        "description": description,
+                        "implementation_guide": get_field_value(error, "implementation_guide", "")
+                    }
+                st.caption(description)
+            
+            submitted = st.form_submit_button(t("apply_selection"))
+        
+        if submitted:
+            # Keep selections that are not on this page and the ones still ticked
+            # here in their original order, then append the newly ticked ones
+            updated = [
+                e for k, e in zip(selected_keys, st.session_state.selected_specific_errors)
+                if k not in visible_keys or k in checked_errors
+            ]
+            updated.extend(e for k, e in checked_errors.items() if k not in selected_index)
+            st.session_state.selected_specific_errors = updated
         
         # Show selected errors
         st.subheader(t("selected_issues"))
@@ -285,18 +319,47 @@ class ErrorSelectorUI:
             st.info(t("no_specific_issues"))
         else:
             for idx, error in enumerate(st.session_state.selected_specific_errors):
+                category = get_field_value(error, 'category', '')
+                name = get_field_value(error, 'name', '')
                 col1, col2 = st.columns([5, 1])
                 with col1:
-                    st.markdown(f"**{get_field_value(error, 'category', '')} - {get_field_value(error, 'name', '')}**")
+                    st.markdown(f"**{category} - {name}**")
                     st.markdown(f"*{get_field_value(error, 'description', '')}*")
                 with col2:
                     # Use numerical index only to avoid potential issues with Chinese characters in keys
                     remove_key = f"remove_{idx}"
-                    if st.button(t("remove"), key=remove_key):
-                        st.session_state.selected_specific_errors.pop(idx)
-                        st.rerun()
+                    st.button(t("remove"), key=remove_key, on_click=self._remove_specific_error, args=((category, name),))
+    
+    @staticmethod
+    def _store_error_page(category: str, page_key: str) -> None:
+        """
+        Remember the page shown for a category; used as the page input callback.
         
-        return st.session_state.selected_specific_errors
+        Args:
+            category: Category whose page changed
+            page_key: Widget key of the page number input
+        """
+        st.session_state.error_pages[category] = st.session_state[page_key]
+    
+    @staticmethod
+    def _remove_specific_error(error_key: Tuple[str, str]) -> None:
+        """
+        Remove a selected specific error; used as the Remove button callback.
+        
+        The error is identified by (category, name) rather than its list
+        position, so a stale click can never remove a different entry.
+        
+        Args:
+            error_key: Tuple of (category, name) of the error to remove
+        """
+        st.session_state.selected_specific_errors = [
+            e for e in st.session_state.selected_specific_errors
+            if (get_field_value(e, "category", ""), get_field_value(e, "name", "")) != error_key
+        ]
+        
+        # Forget the error's checkbox state as well; otherwise it stays ticked
+        # and the next "Apply Selection" would add the error back
+        st.session_state.pop(_error_checkbox_key(error_key), None)
         
     def render_mode_selector(self) -> str:
         """
@@ -307,51 +370,25 @@ class ErrorSelectorUI:
         """
         st.markdown("#### " + t("error_selection_mode"))
         
-        # Create a more descriptive selection with radio buttons
-        mode_options = [
-            t("advanced_mode"),
-            t("specific_mode")
-        ]
-        
         # Convert session state to index
-        current_mode = st.session_state.error_selection_mode
-        current_index = 0
-        if current_mode == "specific":
-            current_index = 1
-        
-        # Error selection mode radio buttons with CSS class for styling
-        st.markdown('<div class="error-mode-radio">', unsafe_allow_html=True)
-        selected_option = st.radio(
+        current_index = _MODES.index(st.session_state.error_selection_mode) if st.session_state.error_selection_mode in _MODES else 0
+        
+        # Error selection mode radio buttons; the options are the mode names
+        # themselves, only their labels are translated
+        new_mode = st.radio(
             t("error_selection_prompt"),
-            options=mode_options,
+            options=_MODES,
             index=current_index,
+            format_func=lambda mode: t(f"{mode}_mode"),
             key="error_mode_radio",
             label_visibility="collapsed",
             horizontal=True
         )
-        st.markdown('</div>', unsafe_allow_html=True)
-        
-        # Update error selection mode based on selection
-        new_mode = st.session_state.error_selection_mode
-        if t("advanced_mode") in selected_option and st.session_state.error_selection_mode != "advanced":
-            new_mode = "advanced"
-        elif t("specific_mode") in selected_option and st.session_state.error_selection_mode != "specific":
-            new_mode = "specific"
         
         # Only update if the mode has changed
         if new_mode != st.session_state.error_selection_mode:
-            # Store previous mode for reference
-            previous_mode = st.session_state.error_selection_mode
-            
-            # Update the mode
             st.session_state.error_selection_mode = new_mode
-                
-            # Initialize or reset appropriate selections when mode changes
-            if new_mode == "specific":
-                # Make sure selected_specific_errors exists
-                if "selected_specific_errors" not in st.session_state:
-                    st.session_state.selected_specific_errors = []
-        
+            st.session_state.setdefault("selected_specific_errors", [])
         
         return st.session_state.error_selection_mode
     
@@ -363,22 +400,9 @@ class ErrorSelectorUI:
         # Normalize the user level to lowercase and default to medium if None
         normalized_level = user_level.lower() if user_level else "medium"
         
-        # Set appropriate difficulty based on normalized user level
-        difficulty_mapping = {
-            "basic": f"{t('easy')}",
-            "medium": f"{t('medium')}",
-            "senior": f"{t('hard')}"
-        }
-        difficulty_level = get_field_value(difficulty_mapping, normalized_level, "medium")
-        
-        # Set code length based on difficulty
-        length_mapping = {
-           f"{t('easy')}": f"{t('short')}",
-           f"{t('medium')}": f"{t('medium')}",
-           f"{t('hard')}": f"{t('long')}"
-        }
-        code_length = get_field_value(length_mapping, difficulty_level, "medium")
-       
+        # Translated difficulty and code length, memoized per level and language
+        difficulty_level, code_length = _code_params_for(normalized_level, get_current_language())
+        
         # Update session state for consistency
         st.session_state.difficulty_level = difficulty_level.capitalize()
         st.session_state.code_length = code_length.capitalize()
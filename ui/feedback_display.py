@@ -6,18 +6,62 @@ This module provides the FeedbackDisplayUI class for displaying feedback on stud
 
 import streamlit as st
 import logging
-import pandas as pd
-import matplotlib.pyplot as plt
+from functools import lru_cache
 from typing import List, Dict, Any, Optional, Tuple, Callable
-from utils.language_utils import t, get_current_language, get_field_value, get_state_attribute  # Add get_state_attribute
+from utils.language_utils import t, get_current_language, get_field_value, get_state_attribute
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Logging is configured once by the app entry point (app.py)
 logger = logging.getLogger(__name__)
 
+# Every label this module renders, translated together once per language
+_LABEL_KEYS = (
+    "no_analysis_results", "educational_feedback", "your_review", "your_final_review",
+    "issues_found", "of", "accuracy", "false_positives", "review_history", "attempt",
+    "found", "issues", "detailed_analysis", "identified_issues", "missed_issues",
+    "review_performance_summary", "overall_accuracy", "issues_identified",
+    "no_identified_issues", "correctly_identified_issues", "all_issues_found",
+    "issues_missed"
+)
+
+# Issue list entries, filled in with str.format for each identified or missed issue
+_IDENTIFIED_ISSUE_TMPL = (
+    '<div style="border-left: 4px solid #4CAF50; padding: 10px; margin: 10px 0; border-radius: 4px;">'
+    '<strong>✓ {i}. {text}</strong></div>\n\n'
+)
+_MISSED_ISSUE_TMPL = (
+    '<div style="border-left: 4px solid #f44336; padding: 10px; margin: 10px 0; border-radius: 4px;">'
+    '<strong>✗ {i}. {text}</strong></div>\n\n'
+)
+
+@lru_cache(maxsize=4)
+def _labels(lang: str) -> Dict[str, str]:
+    """
+    Get this module's labels translated into a language.
+    
+    Args:
+        lang: Language code (e.g., 'en', 'zh-tw')
+        
+    Returns:
+        Dictionary mapping each key in _LABEL_KEYS to its translation
+    """
+    return {key: t(key) for key in _LABEL_KEYS}
+
+@lru_cache(maxsize=8)
+def _wrap_comparison(report: str) -> str:
+    """
+    Wrap a comparison report in its styled container.
+    
+    The report stays the same across reruns of the feedback tab, so the
+    wrapped string is built once instead of copying the whole report each time.
+    
+    Args:
+        report: Comparison report HTML/markdown
+        
+    Returns:
+        Report wrapped in the comparison-report div
+    """
+    return f'<div class="comparison-report">{report}</div>'
+
 class FeedbackDisplayUI:
     """
     UI Component for displaying feedback on student reviews.
@@ -42,68 +86,75 @@ class FeedbackDisplayUI:
             review_history: History of review iterations
             on_reset_callback: Callback function when reset button is clicked
         """
+        # Translated labels for the current language
+        labels = _labels(get_current_language())
+        
         if not comparison_report and not review_summary and not review_analysis:
-            st.info(t("no_analysis_results"))
+            st.info(labels["no_analysis_results"])
             return
         
+        # Number of review iterations, looked up once
+        n_hist = len(review_history) if review_history else 0
+        
         # First show performance summary metrics at the top
-        if review_history and len(review_history) > 0 and review_analysis:
+        if n_hist and review_analysis:
             self._render_performance_summary(review_analysis, review_history)
         
         # Display the comparison report
         if comparison_report:
-            st.subheader(t("educational_feedback"))
-            st.markdown(
-                f'<div class="comparison-report">{comparison_report}</div>',
-                unsafe_allow_html=True
-            )
+            st.subheader(labels["educational_feedback"])
+            st.markdown(_wrap_comparison(comparison_report), unsafe_allow_html=True)
         
         # Always show review history for better visibility
-        if review_history and len(review_history) > 0:
-            st.subheader(t("your_review"))
+        if n_hist:
+            st.subheader(labels["your_review"])
             
             # First show the most recent review prominently
-            if review_history:
-                latest_review = review_history[-1]
-                review_analysis = get_field_value(latest_review, "review_analysis", {})
-                iteration = get_field_value(latest_review, "iteration_number", 0)
-                
-                st.markdown(f"#### {t('your_final_review').format(iteration=iteration)}")
-                
-                # Format the review text with syntax highlighting
-                st.markdown("```text\n" + get_field_value(latest_review, "student_review", "") + "\n```")
-                
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    # Use get_field_value for language-aware access
-                    identified_count = get_field_value(review_analysis, "identified_count", 0)
-                    total_problems = get_field_value(review_analysis, "total_problems", 0)
-                    st.metric(
-                        t("issues_found"), 
-                        f"{identified_count} {t('of')} {total_problems}",
-                        delta=None
-                    )
-                with col2:
-                    # Use get_field_value for language-aware access
-                    accuracy = get_field_value(review_analysis, "accuracy_percentage", 0)
-                    st.metric(
-                        t("accuracy"), 
-                        f"{accuracy:.1f}%",
-                        delta=None
-                    )
-                with col3:
-                    # Use get_field_value for language-aware access
-                    false_positives = len(get_field_value(review_analysis, "false_positives", []))
-                    st.metric(
-                        t("false_positives"), 
-                        false_positives,
-                        delta=None
-                    )
+            latest_review = review_history[-1]
+            review_analysis = get_field_value(latest_review, "review_analysis", {})
+            iteration = get_field_value(latest_review, "iteration_number", 0)
+            
+            st.markdown(f"#### {labels['your_final_review'].format(iteration=iteration)}")
+            
+            # Format the review text with syntax highlighting
+            st.markdown("```text\n" + get_field_value(latest_review, "student_review", "") + "\n```")
+            
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                # Use get_field_value for language-aware access
+                identified_count = get_field_value(review_analysis, "identified_count", 0)
+                total_problems = get_field_value(review_analysis, "total_problems", 0)
+                st.metric(
+                    labels["issues_found"], 
+                    f"{identified_count} {labels['of']} {total_problems}",
+                    delta=None
+                )
+            with col2:
+                # Use get_field_value for language-aware access
+                accuracy = get_field_value(review_analysis, "accuracy_percentage", 0)
+                st.metric(
+                    labels["accuracy"], 
+                    f"{accuracy:.1f}%",
+                    delta=None
+                )
+            with col3:
+                # Use get_field_value for language-aware access
+                false_positives = len(get_field_value(review_analysis, "false_positives", []))
+                st.metric(
+                    labels["false_positives"], 
+                    false_positives,
+                    delta=None
+                )
             
             # Show earlier reviews in an expander if there are multiple
-            if len(review_history) > 1:
-                with st.expander(t("review_history"), expanded=False):
-                    tabs = st.tabs([f"{t('attempt')} {get_field_value(rev, 'iteration_number', i+1)}" for i, rev in enumerate(review_history)])
+            if n_hist > 1:
+                with st.expander(labels["review_history"], expanded=False):
+                    # Translate the tab prefix and the per-attempt summary line once, not per attempt
+                    attempt_label = labels['attempt']
+                    summary_tmpl = (f"**{labels['found']}:** {{identified}} {labels['of']} "
+                                    f"{{total}} {labels['issues']} "
+                                    f"({{accuracy:.1f}}% {labels['accuracy']})")
+                    tabs = st.tabs([f"{attempt_label} {get_field_value(rev, 'iteration_number', i+1)}" for i, rev in enumerate(review_history)])
                     
                     for i, (tab, review) in enumerate(zip(tabs, review_history)):
                         with tab:
@@ -115,14 +166,12 @@ class FeedbackDisplayUI:
                             total_problems = get_field_value(review_analysis, "total_problems", 0)
                             accuracy = get_field_value(review_analysis, "accuracy_percentage", 0)
                             
-                            st.write(f"**{t('found')}:** {identified_count} {t('of')} "
-                                    f"{total_problems} {t('issues')} "
-                                    f"({accuracy:.1f}% {t('accuracy')})")
+                            st.write(summary_tmpl.format(identified=identified_count, total=total_problems, accuracy=accuracy))
         
         # Display analysis details in an expander
         if review_summary or review_analysis:
-            with st.expander(t("detailed_analysis"), expanded=True):
-                tabs = st.tabs([t("identified_issues"), t("missed_issues")])
+            with st.expander(labels["detailed_analysis"], expanded=True):
+                tabs = st.tabs([labels["identified_issues"], labels["missed_issues"]])
                 
                 with tabs[0]:  # Identified Issues
                     self._render_identified_issues(review_analysis)
@@ -135,11 +184,16 @@ class FeedbackDisplayUI:
             
     def _render_performance_summary(self, review_analysis: Dict[str, Any], review_history: List[Dict[str, Any]]):
         """Render performance summary metrics and charts with proper Chinese font support"""
-        st.subheader(t("review_performance_summary"))
+        # Translated labels for the current language
+        labels = _labels(get_current_language())
+        
+        st.subheader(labels["review_performance_summary"])
         
         # Create performance metrics using the original error count if available
         col1, col2, col3 = st.columns(3)
         
+        identified_count = get_field_value(review_analysis, "identified_count", 0)
+        
         # Get the correct total_problems count from original_error_count if available
         original_error_count = get_field_value(review_analysis, "original_error_count", 0)
         if original_error_count <= 0:
@@ -148,24 +202,22 @@ class FeedbackDisplayUI:
         
         # If still zero, make a final check with the found and missed counts
         if original_error_count <= 0:
-            identified_count = get_field_value(review_analysis, "identified_count", 0)
             missed_count = len(get_field_value(review_analysis, "missed_problems", []))
             original_error_count = identified_count + missed_count
         
         # Now calculate the accuracy using the original count for consistency
-        identified_count = get_field_value(review_analysis, "identified_count", 0)
         accuracy = (identified_count / original_error_count * 100) if original_error_count > 0 else 0
         
         with col1:
             st.metric(
-                t("overall_accuracy"), 
+                labels["overall_accuracy"], 
                 f"{accuracy:.1f}%",
                 delta=None
             )
                 
         with col2:
             st.metric(
-                t("issues_identified"), 
+                labels["issues_identified"], 
                 f"{identified_count}/{original_error_count}",
                 delta=None
             )
@@ -173,7 +225,7 @@ class FeedbackDisplayUI:
         with col3:
             false_positives = len(get_field_value(review_analysis, "false_positives", []))
             st.metric(
-                t("false_positives"), 
+                labels["false_positives"], 
                 f"{false_positives}",
                 delta=None
             )
@@ -182,50 +234,38 @@ class FeedbackDisplayUI:
     
     def _render_identified_issues(self, review_analysis: Dict[str, Any]):
         """Render identified issues section with language support"""
+        # Translated labels for the current language
+        labels = _labels(get_current_language())
+        
         # Use get_field_value for language-aware access
         identified_problems = get_field_value(review_analysis, "identified_problems", [])
         
         if not identified_problems:
-            st.info(t("no_identified_issues"))
+            st.info(labels["no_identified_issues"])
             return
                 
-        st.subheader(f"{t('correctly_identified_issues')} ({len(identified_problems)})")
+        st.subheader(f"{labels['correctly_identified_issues']} ({len(identified_problems)})")
         
-        for i, issue in enumerate(identified_problems, 1):
-            issue_text = issue
-            if isinstance(issue, dict):
-                issue_text = get_field_value(issue, "problem", str(issue))
-            
-            st.markdown(
-                f"""
-                <div style="border-left: 4px solid #4CAF50; padding: 10px; margin: 10px 0; border-radius: 4px;">
-                <strong>✓ {i}. {issue_text}</strong>
-                </div>
-                """, 
-                unsafe_allow_html=True
-            )
+        # Normalize dict issues to their text up front, then build every issue
+        # into one HTML string so the list is sent as a single element
+        texts = [get_field_value(x, "problem", str(x)) if isinstance(x, dict) else x for x in identified_problems]
+        st.markdown("".join(_IDENTIFIED_ISSUE_TMPL.format(i=i, text=text) for i, text in enumerate(texts, 1)), unsafe_allow_html=True)
 
     def _render_missed_issues(self, review_analysis: Dict[str, Any]):
         """Render missed issues section with language support"""
+        # Translated labels for the current language
+        labels = _labels(get_current_language())
+        
         # Use get_field_value for language-aware access
         missed_problems = get_field_value(review_analysis, "missed_problems", [])
         
         if not missed_problems:
-            st.success(t("all_issues_found"))
+            st.success(labels["all_issues_found"])
             return
                 
-        st.subheader(f"{t('issues_missed')} ({len(missed_problems)})")
+        st.subheader(f"{labels['issues_missed']} ({len(missed_problems)})")
         
-        for i, issue in enumerate(missed_problems, 1):
-            issue_text = issue
-            if isinstance(issue, dict):
-                issue_text = get_field_value(issue, "problem", str(issue))
-                
-            st.markdown(
-                f"""
-                <div style="border-left: 4px solid #f44336; padding: 10px; margin: 10px 0; border-radius: 4px;">
-                <strong>✗ {i}. {issue_text}</strong>
-                </div>
-                """, 
-                unsafe_allow_html=True
-            )
\ No newline at end of file
+        # Normalize dict issues to their text up front, then build every issue
+        # into one HTML string so the list is sent as a single element
+        texts = [get_field_value(x, "problem", str(x)) if isinstance(x, dict) else x for x in missed_problems]
+        st.markdown("".join(_MISSED_ISSUE_TMPL.format(i=i, text=text) for i, text in enumerate(texts, 1)), unsafe_allow_html=True)
@@ -6,52 +6,113 @@ This module provides the functions for rendering the feedback and analysis tab.
 
 import streamlit as st
 import logging
-import time
-import traceback
 from typing import Dict, List, Any, Optional, Callable
 from utils.code_utils import generate_comparison_report
-from utils.language_utils import t, get_current_language, get_field_value, get_state_attribute
+from utils.language_utils import t, get_current_language, get_field_value
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Logging is configured once by the app entry point (app.py)
 logger = logging.getLogger(__name__)
 
+def _build_history_view(review_history_obj: List[Any]) -> List[Dict[str, Any]]:
+    """
+    Convert review attempts to the dicts expected by FeedbackDisplayUI.
+    
+    The converted list is kept in session state together with the source list,
+    and the history only grows, so each rerun converts just the attempts added
+    since the last one.
+    
+    Args:
+        review_history_obj: List of ReviewAttempt objects from the workflow state
+        
+    Returns:
+        List of review history dicts
+    """
+    source, view = st.session_state.get("feedback_history_view", (None, []))
+    if source is not review_history_obj or len(view) > len(review_history_obj):
+        view = []
+    
+    for review in review_history_obj[len(view):]:
+        view.append({
+            "iteration_number": review.iteration_number,
+            "student_review": review.student_review,
+            "review_analysis": review.analysis
+        })
+    
+    st.session_state.feedback_history_view = (review_history_obj, view)
+    return view
+
+def _start_new_session() -> None:
+    """
+    Reset the session for a new review; used as the "Start New Session" button callback.
+    """
+    # Forget which iterations already updated the user statistics
+    st.session_state.stats_updated = {}
+    
+    # The next review builds its own summary
+    st.session_state.pop("feedback_summary_sig", None)
+    
+    # Set the full reset flag
+    st.session_state.full_reset = True
+    
+    # Return to the generate tab
+    st.session_state.active_tab = 0
+
 def render_feedback_tab(workflow, feedback_display_ui, auth_ui=None):
     """
     Render the feedback and analysis tab with enhanced visualization 
     and user statistics updating.
     
+    Args:
+        workflow: The JavaCodeReviewGraph workflow instance
+        feedback_display_ui: FeedbackDisplayUI instance for rendering feedback
+        auth_ui: Optional AuthUI instance for updating user statistics
+    """
+    _feedback_fragment(workflow, feedback_display_ui, auth_ui)
+
+@st.fragment
+def _feedback_fragment(workflow, feedback_display_ui, auth_ui=None):
+    """
+    Render the body of the feedback tab as a fragment, so interactions inside
+    the tab rerun only this panel instead of the whole app.
+    
     Args:
         workflow: The JavaCodeReviewGraph workflow instance
         feedback_display_ui: FeedbackDisplayUI instance for rendering feedback
         auth_ui: Optional AuthUI instance for updating user statistics
     """
     state = st.session_state.workflow_state
+    
+    # WorkflowState is a pydantic model, so every field below always exists;
+    # read the ones used throughout this tab once
+    current_iteration = state.current_iteration
+    max_iterations = state.max_iterations
+    review_history_obj = state.review_history
+    review_summary = state.review_summary
+    comparison_report = state.comparison_report
+
+    # Nothing to show yet: skip the completion checks, report generation and rendering
+    if not review_history_obj and not comparison_report and not review_summary:
+        st.info(t("no_analysis_results"))
+        return
 
     # Add debug message to check what's being passed
-    logger.info(f"Feedback tab received auth_ui: {auth_ui is not None}")
+    logger.info("Feedback tab received auth_ui: %s", auth_ui is not None)
 
-    # Check if review process is completed
-    review_completed = False
-    if hasattr(state, 'current_iteration') and hasattr(state, 'max_iterations'):
-        current_iteration = get_state_attribute(state, 'current_iteration', 1)
-        max_iterations = get_state_attribute(state, 'max_iterations', 3)
-        
+    # Check if review process is completed; once it is, the flag on the state
+    # short-circuits the checks below on every later rerun
+    review_completed = state.review_completed
+    if not review_completed:
         if current_iteration > max_iterations:
             review_completed = True
             logger.info(t("review_completed_max_iterations"))
-        elif get_state_attribute(state, 'review_sufficient', False):
+        elif state.review_sufficient:
             review_completed = True
             logger.info(t("review_completed_sufficient"))
         
         # Check for all errors identified - HIGHEST PRIORITY CHECK
-        review_history = get_state_attribute(state, 'review_history', [])
-        if review_history and len(review_history) > 0:
-            latest_review = review_history[-1]
-            analysis = latest_review.analysis if hasattr(latest_review, 'analysis') else {}
+        if review_history_obj:
+            latest_review = review_history_obj[-1]
+            analysis = latest_review.analysis
             
             # Use get_field_value for language-aware field access
             identified_count = get_field_value(analysis, "identified_count", 0)
@@ -61,12 +122,13 @@ def render_feedback_tab(workflow, feedback_display_ui, auth_ui=None):
                 review_completed = True
                 # Ensure state is consistent
                 state.review_sufficient = True
-                logger.info(f"{t('review_completed_all_identified')} {total_problems} {t('issues')}")
+                logger.info("%s %s %s", t('review_completed_all_identified'), total_problems, t('issues'))
+        
+        if review_completed:
+            state.review_completed = True
 
     # Block access if review not completed
     if not review_completed:
-        current_iteration = get_state_attribute(state, 'current_iteration', 1)
-        max_iterations = get_state_attribute(state, 'max_iterations', 3)
         st.warning(f"{t('complete_review_first')}")
         st.info(f"{t('current_process_review1')} {current_iteration-1}/{max_iterations} {t('current_process_review2')}")       
         return
@@ -76,56 +138,57 @@ def render_feedback_tab(workflow, feedback_display_ui, auth_ui=None):
     review_history = []
     
     # Make sure we have review history
-    if get_state_attribute(state, 'review_history', None):
-        review_history_obj = get_state_attribute(state, 'review_history', [])
-        latest_review = review_history_obj[-1] if review_history_obj else None
+    if review_history_obj:
+        latest_review = review_history_obj[-1]
         
         # Convert review history to the format expected by FeedbackDisplayUI
-        for review in review_history_obj:
-            review_history.append({
-                "iteration_number": review.iteration_number,
-                "student_review": review.student_review,
-                "review_analysis": review.analysis
-            })
+        review_history = _build_history_view(review_history_obj)
     
     if latest_review and latest_review.analysis:
         # Get the original error count
-        original_error_count = get_state_attribute(state, 'original_error_count', 0)
+        original_error_count = state.original_error_count
         if original_error_count <= 0:
             # Use get_field_value for language-aware field access
             original_error_count = get_field_value(latest_review.analysis, "total_problems", 0)
         
         # Use get_field_value for language-aware field access
         identified_count = get_field_value(latest_review.analysis, "identified_count", 0)
-        identified_percentage = (identified_count / original_error_count * 100) if original_error_count > 0 else 0
         
-        state.review_summary = (
-            f"# {t('review_summary')}\n\n"
-            f"{t('you_found')} {identified_count} {t('of')} {original_error_count} {t('issues')} "
-            f"({identified_percentage:.1f}% {t('accuracy')}).\n\n"
-            f"{t('check_detailed_analysis')}"
-        )
+        # Only rebuild the summary when its inputs change; the language is part of
+        # the signature so switching languages still refreshes it. The signature is
+        # kept in session state (WorkflowState rejects unknown attributes) together
+        # with the text built for it, so a summary set elsewhere, e.g. by the
+        # workflow for a later review, is still replaced
+        summary_sig = (original_error_count, identified_count, get_current_language())
+        if st.session_state.get("feedback_summary_sig") != (summary_sig, review_summary):
+            identified_percentage = (identified_count / original_error_count * 100) if original_error_count > 0 else 0
+            review_summary = state.review_summary = (
+                f"# {t('review_summary')}\n\n"
+                f"{t('you_found')} {identified_count} {t('of')} {original_error_count} {t('issues')} "
+                f"({identified_percentage:.1f}% {t('accuracy')}).\n\n"
+                f"{t('check_detailed_analysis')}"
+            )
+            st.session_state.feedback_summary_sig = (summary_sig, review_summary)
 
     # If we have review history but no comparison report, generate one
-    comparison_report = get_state_attribute(state, 'comparison_report', None)
     if latest_review and latest_review.analysis and not comparison_report:
         try:
             # Get the known problems from the evaluation result instead of code_snippet.known_problems
-            evaluation_result = get_state_attribute(state, 'evaluation_result', None)
+            evaluation_result = state.evaluation_result
             if evaluation_result and 'found_errors' in evaluation_result:
                 found_errors = get_field_value(evaluation_result, 'found_errors', [])
                 
                 # Generate a comparison report if it doesn't exist
-                state.comparison_report = generate_comparison_report(
+                comparison_report = state.comparison_report = generate_comparison_report(
                     found_errors,
                     latest_review.analysis
                 )
                 logger.info(t("generated_comparison_report"))
         except Exception as e:
-            logger.error(f"{t('error')} {t('generating_comparison_report')}: {str(e)}")
-            logger.error(traceback.format_exc())  # Log full stacktrace
-            if not get_state_attribute(state, 'comparison_report', None):
-                state.comparison_report = (
+            # logger.exception records the stack trace with the message
+            logger.exception("%s %s: %s", t('error'), t('generating_comparison_report'), e)
+            if not comparison_report:
+                comparison_report = state.comparison_report = (
                     f"# {t('review_feedback')}\n\n"
                     f"{t('error_generating_report')} "
                     f"{t('check_review_history')}."
@@ -134,63 +197,76 @@ def render_feedback_tab(workflow, feedback_display_ui, auth_ui=None):
     # Get the latest review analysis
     latest_analysis = latest_review.analysis if latest_review else None
     
+    # Show the level-up celebration carried over from the rerun below
+    level_up_notice = st.session_state.pop("level_up_notice", None)
+    if level_up_notice:
+        score_added, old_level, new_level = level_up_notice
+        st.success(f"{t('statistics_updated')}! {t('added')} {score_added} {t('to_your_score')}.")
+        st.balloons()  # Add visual celebration effect
+        st.success(f"🎉 {t('congratulations')}! {t('level_upgraded')} {old_level} {t('to')} {new_level}!")
+    
     # Update user statistics if AuthUI is provided and we have analysis
     if auth_ui and latest_analysis:       
-        current_iteration = get_state_attribute(state, 'current_iteration', 1) 
         # Use get_field_value for language-aware field access
-        identified_count = get_field_value(latest_analysis, "identified_count", 0)
-        stats_key = f"stats_updated_{current_iteration}_{identified_count}"
+        # Coerce once here so update_review_stats can trust its int argument
+        identified_count = int(get_field_value(latest_analysis, "identified_count", 0) or 0)
+        stats_key = (current_iteration, identified_count)
+        # Update results are kept in one dict so they can be reset in one assignment
+        stats_updated = st.session_state.setdefault("stats_updated", {})
     
-        if stats_key not in st.session_state:
+        if stats_key not in stats_updated:
+            level_changed = False
             try:
                 # Extract accuracy and identified_count from the latest review
                 # Use get_field_value for language-aware field access
                 accuracy = get_field_value(latest_analysis, "identified_percentage", 0)
                 
-                # Log details before update
-                logger.info(f"{t('preparing_update_stats')}: {t('accuracy')}={accuracy:.1f}%, " + 
-                        f"{t('score')}={identified_count} ({t('identified_count')}), key={stats_key}")
+                # Log details before update; the message is only built when INFO is enabled
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("%s: %s=%.1f%%, %s=%d (%s), key=%s",
+                                t('preparing_update_stats'), t('accuracy'), accuracy,
+                                t('score'), identified_count, t('identified_count'), stats_key)
                 
                 # Update user stats with identified_count as score
                 result = auth_ui.update_review_stats(accuracy, identified_count)
                 
                 # Store the update result for debugging
-                st.session_state[stats_key] = result
+                stats_updated[stats_key] = result
                 
                 # Log the update result
                 # Use get_field_value for language-aware field access
                 if result and get_field_value(result, "success", False):
-                    logger.info(f"{t('successfully_updated_statistics')}: {result}")
-                    
-                    # Add explicit UI message about the update
-                    st.success(f"{t('statistics_updated')}! {t('added')} {identified_count} {t('to_your_score')}.")
+                    logger.info("%s: %s", t('successfully_updated_statistics'), result)
                     
                     # Show level promotion message if level changed
                     # Use get_field_value for language-aware field access
                     if get_field_value(result, "level_changed", False):
-                        old_level = get_field_value(result, "old_level", "").capitalize()
-                        new_level = get_field_value(result, "new_level", "").capitalize()
-                        st.balloons()  # Add visual celebration effect
-                        st.success(f"🎉 {t('congratulations')}! {t('level_upgraded')} {old_level} {t('to')} {new_level}!")
-                    
-                    # Give the database a moment to complete the update
-                    time.sleep(0.5)
-                    
-                    # Force UI refresh after successful update
-                    st.rerun()
+                        # The user level was already read earlier in this run (e.g.
+                        # for the generate tab), so rerun the app to pick up the new
+                        # level and show the messages after the rerun
+                        level_changed = True
+                        st.session_state.level_up_notice = (
+                            identified_count,
+                            get_field_value(result, "old_level", "").capitalize(),
+                            get_field_value(result, "new_level", "").capitalize()
+                        )
+                    else:
+                        # Add explicit UI message about the update
+                        st.success(f"{t('statistics_updated')}! {t('added')} {identified_count} {t('to_your_score')}.")
                 else:
                     # Use get_field_value for language-aware field access
                     err_msg = get_field_value(result, 'error', t('unknown_error')) if result else t('no_result_returned')
                     logger.error(f"{t('failed_update_statistics')}: {err_msg}")
                     st.error(f"{t('failed_update_statistics')}: {err_msg}")
             except Exception as e:
-                logger.error(f"{t('error')} {t('updating_user_statistics')}: {str(e)}")
-                logger.error(traceback.format_exc())
+                logger.exception("%s %s: %s", t('error'), t('updating_user_statistics'), e)
                 st.error(f"{t('error')} {t('updating_statistics')}: {str(e)}")
+            
+            # Only a level change needs a full rerun; other stats are redrawn in place
+            if level_changed:
+                st.rerun(scope="app")
     
     # Display feedback results
-    review_summary = get_state_attribute(state, 'review_summary', None)
-    comparison_report = get_state_attribute(state, 'comparison_report', None)
     feedback_display_ui.render_results(
         comparison_report=comparison_report,
         review_summary=review_summary,
@@ -205,17 +281,7 @@ def render_feedback_tab(workflow, feedback_display_ui, auth_ui=None):
         st.markdown(f"### {t('new_session')}")
         st.markdown(t("new_session_desc"))
     with new_session_col2:
-        if st.button(t("start_new_session"), use_container_width=True):
-            # Clear all update keys in session state
-            keys_to_remove = [k for k in st.session_state.keys() if k.startswith("stats_updated_")]
-            for key in keys_to_remove:
-                del st.session_state[key]
-                
-            # Set the full reset flag
-            st.session_state.full_reset = True
-            
-            # Return to the generate tab
-            st.session_state.active_tab = 0
-            
-            # Force UI refresh
-            st.rerun()
\ No newline at end of file
+        # The callback sets the reset flag before this fragment reruns; the reset
+        # itself is handled by the app, so escalate to a full-app rerun
+        if st.button(t("start_new_session"), use_container_width=True, on_click=_start_new_session):
+            st.rerun(scope="app")
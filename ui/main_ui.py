@@ -77,6 +77,55 @@ def init_session_state():
         # Remove the direct reference to avoid confusion
         del st.session_state.code_snippet
 
+def _log_files_fingerprint(log_dir: str) -> tuple:
+    """
+    Build a cheap fingerprint of the log files on disk.
+
+    Only file metadata is read, so this is much cheaper than loading the logs;
+    it changes whenever a log file is added, removed or rewritten.
+
+    Args:
+        log_dir: Directory containing the LLM log files
+
+    Returns:
+        Tuple of (number of .json files, newest modification time in ns)
+    """
+    count, newest = 0, 0
+    for root, _, files in os.walk(log_dir):
+        for file in files:
+            if file.endswith(".json"):
+                try:
+                    mtime = os.stat(os.path.join(root, file)).st_mtime_ns
+                except OSError:
+                    continue
+                count += 1
+                newest = max(newest, mtime)
+    return count, newest
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _load_recent_logs(_llm_logger, logger_id: int, limit: int, fingerprint: tuple) -> tuple:
+    """
+    Load recent logs together with the type and date filter options.
+
+    Cached so that reruns of the logs tab (slider moves, checkbox toggles,
+    tab switches) do not re-read the log files from disk. The logger itself is
+    not hashed; logger_id and fingerprint identify its contents instead.
+
+    Args:
+        _llm_logger: LLMInteractionLogger to read from
+        logger_id: Identity of the logger, so sessions do not share entries
+        limit: Maximum number of logs to return
+        fingerprint: Disk fingerprint and in-memory log count
+
+    Returns:
+        Tuple of (logs, sorted log types, sorted dates)
+    """
+    logs = _llm_logger.get_recent_logs(limit)
+    log_types = sorted(set(get_field_value(log, "type", "unknown") for log in logs))
+    timestamps = [get_field_value(log, "timestamp", "") for log in logs if "timestamp" in log or "時間戳記" in log]
+    dates = sorted(set(ts.split("T")[0] for ts in timestamps if "T" in ts))
+    return logs, log_types, dates
+
 def render_llm_logs_tab():
     """Render the LLM logs tab with detailed log information and file browsing capabilities with full translation support and language filtering."""
     st.subheader(t("llm_logs_title") or "LLM Interaction Logs")
@@ -102,22 +151,19 @@ def render_llm_logs_tab():
             language_filter = st.checkbox(t("filter_by_language") or "Filter by language", value=True)
         
         # Get logs (will now include both in-memory and disk logs)
-        logs = llm_logger.get_recent_logs(log_count * 3)  # Get more logs to allow for filtering
-        
+        # Served from cache until a log file or the in-memory log list changes
+        fingerprint = (_log_files_fingerprint(llm_logger.log_dir), len(llm_logger.logs))
+        logs, log_types, dates = _load_recent_logs(llm_logger, id(llm_logger), log_count * 3, fingerprint)  # Get more logs to allow for filtering
+
         if logs:
-            # Add filter for log types - use get_field_value for log type access
-            log_types = sorted(list(set(get_field_value(log, "type", "unknown") for log in logs)))
+            # Add filter for log types
             log_type_filter = st.multiselect(t("filter_by_type") or "Filter by log type:", log_types, default=log_types)
-            
-            # Date filter - use get_field_value for timestamp access
-            timestamps = [get_field_value(log, "timestamp", "") for log in logs if "timestamp" in log or "時間戳記" in log]
-            if timestamps:
-                # Extract dates from timestamps
-                dates = sorted(set(ts.split("T")[0] for ts in timestamps if "T" in ts))
-                if dates:
-                    selected_dates = st.multiselect(t("filter_by_date") or "Filter by date:", dates, default=dates)
-                    # Apply date filter - use get_field_value for timestamp access
-                    logs = [log for log in logs if get_field_value(log, "timestamp", "").split("T")[0] in selected_dates]
+
+            # Date filter
+            if dates:
+                selected_dates = st.multiselect(t("filter_by_date") or "Filter by date:", dates, default=dates)
+                # Apply date filter - use get_field_value for timestamp access
+                logs = [log for log in logs if get_field_value(log, "timestamp", "").split("T")[0] in selected_dates]
             
             # Filter logs by type - use get_field_value for type access
             filtered_logs = [log for log in logs if get_field_value(log, "type", "unknown") in log_type_filter]
@@ -8,7 +8,7 @@ import streamlit as st
 import os
 import logging
 import sys
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Callable
 
 # Add the parent directory to the path to allow absolute imports
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -22,6 +22,9 @@ from language import get_translations, get_llm_prompt_instructions, SUPPORTED_LA
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Translation tables resolved so far, keyed by language code
+_translations_cache: Dict[str, Any] = {}
+
 def init_language():
     """Initialize language selection in session state."""
     if "language" not in st.session_state:
@@ -72,12 +75,39 @@ def t(key: str) -> str:
     Returns:
         Translated text
     """
-    current_lang = get_current_language()
-    translations = get_translations(current_lang)
+    translations = _get_translation_table(get_current_language())
     
     # Return the translation if found, otherwise return the key itself
     return translations.get(key, key)
 
+def get_translator() -> Callable[[str], str]:
+    """
+    Get a translation function bound to the current language.
+    
+    The language is resolved once, so code rendering many labels in one pass
+    avoids a session-state read per label.
+    
+    Returns:
+        Function translating a text key, returning the key if not found
+    """
+    translations = _get_translation_table(get_current_language())
+    return lambda key: translations.get(key, key)
+
+def _get_translation_table(lang: str):
+    """
+    Get the translation table for a language, resolving it on first use.
+    
+    Args:
+        lang: Language code (e.g., 'en', 'zh-tw')
+        
+    Returns:
+        Mapping of text keys to translations
+    """
+    translations = _translations_cache.get(lang)
+    if translations is None:
+        translations = _translations_cache[lang] = get_translations(lang)
+    return translations
+
 def get_llm_instructions() -> str:
     """
     Get the LLM instructions for the current language.
@@ -10,9 +10,19 @@ import json
 import datetime
 import logging
 import re
+import queue
+import threading
+import atexit
 from typing import List, Any, Dict, Optional
 from pathlib import Path
 
+# orjson is much faster than the stdlib json module for the log files read on
+# every render of the logs tab; fall back to json if it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from utils.code_utils import process_llm_response
 from utils.language_utils import get_field_value 
 
@@ -23,6 +33,61 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Log files are written by a single background thread so that LLM calls made
+# on the Streamlit script thread never block on disk I/O
+_write_queue: "queue.Queue[tuple]" = queue.Queue()
+_writer_thread: Optional[threading.Thread] = None
+_writer_lock = threading.Lock()
+
+def _dump_log_entry(log_entry: Dict[str, Any]) -> bytes:
+    """Serialize a log entry as indented UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(log_entry, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(log_entry, indent=2, ensure_ascii=False).encode("utf-8")
+
+def _load_log_entry(data: bytes) -> Dict[str, Any]:
+    """Parse a log entry previously written by _dump_log_entry."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _writer_loop():
+    """Write queued log entries to disk until the process exits."""
+    while True:
+        json_file, text_file, log_entry, text_content = _write_queue.get()
+        try:
+            # Write the JSON entry to a temporary file and rename it into place,
+            # so readers never see a partially written log
+            tmp_file = json_file + ".tmp"
+            with open(tmp_file, 'wb') as f:
+                f.write(_dump_log_entry(log_entry))
+            os.replace(tmp_file, json_file)
+            
+            # Also write a more readable text version for direct inspection
+            with open(text_file, 'w', encoding='utf-8') as f:
+                f.write(text_content)
+                
+            logger.debug(f"Logged {log_entry.get('type')} interaction to {json_file} and {text_file}")
+        except Exception as e:
+            logger.error(f"Error writing log to file: {str(e)}")
+        finally:
+            _write_queue.task_done()
+
+def _ensure_writer_started():
+    """Start the background log writer thread if it is not running yet."""
+    global _writer_thread
+    with _writer_lock:
+        if _writer_thread is None or not _writer_thread.is_alive():
+            _writer_thread = threading.Thread(target=_writer_loop, name="llm-log-writer", daemon=True)
+            _writer_thread.start()
+
+def flush_pending_logs():
+    """Block until all queued log entries have been written to disk."""
+    _write_queue.join()
+
+# Make sure queued logs reach the disk before the interpreter exits
+atexit.register(flush_pending_logs)
+
 class LLMInteractionLogger:
     """
     Logger for LLM interactions to track prompts, responses, and metadata.
@@ -41,6 +106,9 @@ class LLMInteractionLogger:
         self.log_dir = log_dir
         self.logs = []
         
+        # Interaction types whose log directory is known to exist
+        self._known_type_dirs = set()
+        
         # Create log directory if it doesn't exist
         self.ensure_log_directory()
         
@@ -67,6 +135,7 @@ class LLMInteractionLogger:
             type_path = log_path / log_type
             if not type_path.exists():
                 type_path.mkdir(parents=True, exist_ok=True)
+            self._known_type_dirs.add(log_type)
     
     def _ensure_string_response(self, response: Any) -> str:
         """
@@ -161,33 +230,32 @@ class LLMInteractionLogger:
         # Update attempt count
         self._attempt_counts[interaction_type] = self._attempt_counts.get(interaction_type, 0) + 1
         
-        # Create log directory for this interaction type if it doesn't exist
+        # Create log directory for this interaction type if it doesn't exist,
+        # only touching the filesystem the first time a type is seen
         type_dir = os.path.join(self.log_dir, interaction_type)
-        os.makedirs(type_dir, exist_ok=True)
+        if interaction_type not in self._known_type_dirs:
+            os.makedirs(type_dir, exist_ok=True)
+            self._known_type_dirs.add(interaction_type)
         
         # Format timestamp for filename
         file_timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
         log_file = os.path.join(type_dir, f"{file_timestamp}.json")
+        text_file = os.path.join(type_dir, f"{file_timestamp}.txt")
         
-        try:
-            # Write formatted log entry
-            with open(log_file, 'w', encoding='utf-8') as f:
-                json.dump(log_entry, f, indent=2, ensure_ascii=False)
-                
-            # Also write a more readable text version for direct inspection
-            text_file = os.path.join(type_dir, f"{file_timestamp}.txt")
-            with open(text_file, 'w', encoding='utf-8') as f:
-                f.write(f"TIMESTAMP: {timestamp}\n")
-                f.write(f"TYPE: {interaction_type}\n")
-                f.write(f"METADATA: {json.dumps(metadata or {},ensure_ascii=False, indent=2)}\n\n")
-                f.write("=== PROMPT ===\n\n")
-                f.write(formatted_prompt)
-                f.write("\n\n=== RESPONSE ===\n\n")
-                f.write(formatted_response)
-                
-            logger.debug(f"Logged {interaction_type} interaction to {log_file} and {text_file}")
-        except Exception as e:
-            logger.error(f"Error writing log to file: {str(e)}")
+        text_content = (
+            f"TIMESTAMP: {timestamp}\n"
+            f"TYPE: {interaction_type}\n"
+            f"METADATA: {json.dumps(metadata or {},ensure_ascii=False, indent=2)}\n\n"
+            "=== PROMPT ===\n\n"
+            f"{formatted_prompt}"
+            "\n\n=== RESPONSE ===\n\n"
+            f"{formatted_response}"
+        )
+        
+        # Hand the files over to the background writer; the entry is already
+        # available to get_recent_logs through the in-memory list
+        _ensure_writer_started()
+        _write_queue.put((log_file, text_file, log_entry, text_content))
     
     def log_code_generation(self, prompt: str, response: Any, metadata: Optional[Dict[str, Any]] = None) -> None:
         """
@@ -283,8 +351,8 @@ class LLMInteractionLogger:
                 # Read the most recent log files
                 for file_path in log_files[:max(50, limit*2)]:  # Read more than needed for filtering
                     try:
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            log_entry = json.load(f)
+                        with open(file_path, 'rb') as f:
+                            log_entry = _load_log_entry(f.read())
                             # Extract interaction type from directory name
                             type_dir = os.path.basename(os.path.dirname(file_path))
                             if "type" not in log_entry:
@@ -332,6 +400,9 @@ class LLMInteractionLogger:
         import tempfile
         import shutil
         
+        # Make sure every queued log is on disk before archiving
+        flush_pending_logs()
+        
         # Use the specified directory or a temporary one
         if export_dir is None:
             export_dir = tempfile.mkdtemp()